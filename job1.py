@@ -71,6 +71,45 @@ JOB_DATABASE = {
     }
 }
 
+# 常见岗位名称映射
+POSITION_MAPPING = {
+    '前端': '前端开发', 'web前端': '前端开发', '前端工程师': '前端开发',
+    '后端': '后端开发', '后端': '后端开发工程师', 'java': 'Java开发', 'python': 'Python开发',
+    '测试': '软件测试', 'qa': '软件测试', '测试工程师': '软件测试',
+    '产品': '产品经理', '产品设计': '产品经理', 'pm': '产品经理',
+    '运营': '运营专员', '新媒体': '新媒体运营', '内容运营': '内容运营',
+    '销售': '销售代表', '销售': '销售经理', '业务员': '销售代表', 'bd': '商务拓展',
+    '人事': '人力资源', 'hr': '人力资源', '招聘': '招聘专员',
+    '财务': '财务会计', '会计': '财务会计', '出纳': '财务会计',
+    '行政': '行政专员', '文员': '行政专员', '助理': '行政助理'
+}
+
+# 学历等级表
+EDUCATION_LEVELS = {
+    '博士': 5, '博士研究生': 5, '博士及以上': 5,
+    '硕士': 4, '硕士研究生': 4, '硕士及以上': 4,
+    '本科': 3, '学士': 3, '大学': 3, '本科及以上': 3,
+    '大专': 2, '专科': 2, '大专及以上': 2,
+    '高中': 1, '中专': 1, '职高': 1, '高中及以上': 1,
+    '初中': 0
+}
+
+def get_education_level(edu_str):
+    """从学历字符串中提取核心等级"""
+    if edu_str in EDUCATION_LEVELS:
+        return EDUCATION_LEVELS[edu_str]
+    
+    if "及以上" in edu_str or "以上" in edu_str:
+        core_edu = re.sub(r'[及以]上', '', edu_str)
+        if core_edu in EDUCATION_LEVELS:
+            return EDUCATION_LEVELS[core_edu]
+    
+    for level in EDUCATION_LEVELS:
+        if level in edu_str and level != "以上":
+            return EDUCATION_LEVELS[level]
+    
+    return 0
+
 def extract_text_from_pdf(file_path):
     """从PDF文件中提取文本"""
     text = ""
@@ -104,24 +143,11 @@ def normalize_position(position):
     if not position or position.strip() == "":
         return "无"
     
-    # 常见岗位名称映射
-    position_mapping = {
-        '前端': '前端开发', 'web前端': '前端开发', '前端工程师': '前端开发',
-        '后端': '后端开发', '后端': '后端开发工程师', 'java': 'Java开发', 'python': 'Python开发',
-        '测试': '软件测试', 'qa': '软件测试', '测试工程师': '软件测试',
-        '产品': '产品经理', '产品设计': '产品经理', 'pm': '产品经理',
-        '运营': '运营专员', '新媒体': '新媒体运营', '内容运营': '内容运营',
-        '销售': '销售代表', '销售': '销售经理', '业务员': '销售代表', 'bd': '商务拓展',
-        '人事': '人力资源', 'hr': '人力资源', '招聘': '招聘专员',
-        '财务': '财务会计', '会计': '财务会计', '出纳': '财务会计',
-        '行政': '行政专员', '文员': '行政专员', '助理': '行政助理'
-    }
-    
     # 移除无关字符
     clean_position = re.sub(r'[、/（）()【】\[\]\s]', '', position).lower()
     
     # 应用映射
-    for key, value in position_mapping.items():
+    for key, value in POSITION_MAPPING.items():
         if key in clean_position:
             return value
     
@@ -290,31 +316,6 @@ def match_applicant_to_job(applicant_info, job_info):
     }
     
     # 学历匹配
-    education_levels = {
-        '博士': 5, '博士研究生': 5, '博士及以上': 5,
-        '硕士': 4, '硕士研究生': 4, '硕士及以上': 4,
-        '本科': 3, '学士': 3, '大学': 3, '本科及以上': 3,
-        '大专': 2, '专科': 2, '大专及以上': 2,
-        '高中': 1, '中专': 1, '职高': 1, '高中及以上': 1,
-        '初中': 0
-    }
-    
-    def get_education_level(edu_str):
-        """从学历字符串中提取核心等级"""
-        if edu_str in education_levels:
-            return education_levels[edu_str]
-        
-        if "及以上" in edu_str or "以上" in edu_str:
-            core_edu = re.sub(r'[及以]上', '', edu_str)
-            if core_edu in education_levels:
-                return education_levels[core_edu]
-        
-        for level in education_levels:
-            if level in edu_str and level != "以上":
-                return education_levels[level]
-        
-        return 0
-    
     applicant_edu = applicant_info.get('学历', '')
     job_edu = job_info.get('学历要求', '')
     
@@ -0,0 +1,22 @@
+import job1
+
+
+def test_normalize_position_keeps_mapping_order():
+    # 重复键保留首次出现的位置、最后一次的值
+    assert job1.normalize_position('后端') == '后端开发工程师'
+    assert job1.normalize_position('销售') == '销售经理'
+    assert job1.normalize_position('web前端') == '前端开发'
+    assert job1.normalize_position('') == '无'
+
+
+def test_sales_job_requirements():
+    job = job1.JOB_DATABASE['销售岗']
+    assert job1.get_education_level(job['学历要求']) == 1
+    assert job1.extract_salary_range(job['薪资范围']) == (8000.0, 8000.0)
+
+    result = job1.match_applicant_to_job({'学历': '高中', '工作经验': '3年'}, job)
+    assert result['学历匹配'] == '符合'
+    assert result['工作经验匹配'] == '符合'
+
+    result = job1.match_applicant_to_job({'学历': '高中', '工作经验': '2年'}, job)
+    assert result['工作经验匹配'] == '不符合'